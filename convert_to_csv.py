@@ -1,24 +1,105 @@
+import csv
+import datetime
 import os
 import sys
+from typing import Any, List, Optional, Sequence, Tuple
+
+
+def _dedupe_header(header: Sequence[Any]) -> List[str]:
+	"""Name header cells the way pandas does (``Unnamed: N``, ``name.1``...)."""
+	names = [
+		f"Unnamed: {idx}" if value is None else str(value)
+		for idx, value in enumerate(header)
+	]
+	# 先处理有名称的列，再处理 Unnamed 列；跳过表头中已存在的名称
+	unnamed = [idx for idx, value in enumerate(header) if value is None]
+	order = [idx for idx, value in enumerate(header) if value is not None] + unnamed
+	counts: dict = {}
+	for idx in order:
+		name = original = names[idx]
+		count = counts.get(name, 0)
+		while count > 0:
+			counts[original] = count + 1
+			name = f"{original}.{count}"
+			count = count + 1 if name in names else counts.get(name, 0)
+		names[idx] = name
+		counts[name] = count + 1
+	return names
+
+
+def _format_cell(value: Any) -> Any:
+	"""Render date cells without a time part as ISO dates, like pandas."""
+	if isinstance(value, datetime.datetime):
+		if value.time() == datetime.time(0, 0):
+			return value.date().isoformat()
+		return value
+	if isinstance(value, datetime.date):
+		return value.isoformat()
+	return value
+
+
+def _scan_sheet(ws: Any) -> Tuple[Optional[int], int, int]:
+	"""First pass: locate the first/last non-blank rows and the widest row.
+
+	Returns ``(first, last, width)``; ``first`` is None for an empty sheet.
+	"""
+	first: Optional[int] = None
+	last = 0
+	width = 0
+	for idx, row in enumerate(ws.iter_rows(values_only=True)):
+		used = len(row)
+		while used and row[used - 1] is None:
+			used -= 1
+		if not used:
+			continue
+		if first is None:
+			first = idx
+		last = idx
+		width = max(width, used)
+	return first, last, width
 
 
 def convert_excel_to_csv(excel_path: str, csv_path: str) -> None:
 	"""Convert the first sheet of an Excel workbook to CSV (UTF-8 with BOM)."""
 	try:
-		import pandas as pd
+		import openpyxl
 	except ImportError as exc:
 		raise SystemExit(
-			"需要安装 pandas：pip install pandas openpyxl"
+			"需要安装 openpyxl：pip install openpyxl"
 		) from exc
 
 	if not os.path.isfile(excel_path):
 		raise FileNotFoundError(f"未找到文件: {excel_path}")
 
-	# 读取第一个工作表
-	df = pd.read_excel(excel_path, sheet_name=0, engine="openpyxl")
-
-	# 导出 CSV（带 BOM，便于在 Excel/记事本下直接显示中文）
-	df.to_csv(csv_path, index=False, encoding="utf-8-sig")
+	# 只读模式按行流式读取第一个工作表
+	wb = openpyxl.load_workbook(excel_path, read_only=True, data_only=True)
+	try:
+		ws = wb.worksheets[0]
+		# 部分导出工具写入的 <dimension> 不可靠，改为按实际单元格读取
+		ws.reset_dimensions()
+
+		# 第一遍：定位首个/最后一个非空行，以及含数据的最大列数。
+		# 表头以首个非空行为准（跳过开头的空行），列宽取所有行中最宽者，
+		# 超出表头的列以 Unnamed: N 命名，不丢弃任何数据。
+		first, last, width = _scan_sheet(ws)
+
+		# 导出 CSV（带 BOM，便于在 Excel/记事本下直接显示中文）
+		with open(csv_path, "w", encoding="utf-8-sig", newline="") as fh:
+			writer = csv.writer(fh, lineterminator="\n")
+			if first is None:
+				# 空工作表：与 pandas 一致，只写出空表头行
+				writer.writerow(())
+				return
+			padding = (None,) * width
+			rows = ws.iter_rows(min_row=first + 1, max_row=last + 1, values_only=True)
+			header = (tuple(next(rows)) + padding)[:width]
+			writer.writerow(_dedupe_header(header))
+			for row in rows:
+				# 中间的空白行保留为空行；末尾空白行已由 last 排除
+				cells = (tuple(row) + padding)[:width]
+				writer.writerow([_format_cell(cell) for cell in cells])
+	finally:
+		wb.close()
 
 
 def read_csv_preview(csv_path: str, max_rows: int = 10) -> str:
@@ -33,9 +114,12 @@ def read_csv_preview(csv_path: str, max_rows: int = 10) -> str:
 	if not os.path.isfile(csv_path):
 		raise FileNotFoundError(f"未找到 CSV 文件: {csv_path}")
 
-	df = pd.read_csv(csv_path, encoding="utf-8-sig")
-	# 预览前 max_rows 行
-	preview = df.head(max_rows)
+	# 仅读取前 max_rows 行用于预览
+	try:
+		preview = pd.read_csv(csv_path, encoding="utf-8-sig", nrows=max_rows)
+	except pd.errors.EmptyDataError:
+		# 空工作表导出的 CSV 只有空表头行
+		return "（CSV 为空，无数据可预览）"
 	return preview.to_string(index=False)
 
 
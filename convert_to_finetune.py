@@ -9,24 +9,36 @@ import argparse
 import csv
 import json
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+# 复用同一个编码器，避免每行重复构造；紧凑分隔符减少输出体积
+_ENCODE = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+# 每累计多少行批量写入一次
+_FLUSH_EVERY = 1024
+
+
+def _column_prefixes(
+	columns: List[str], add_label: bool = True
+) -> List[Tuple[str, str]]:
+	"""预先计算每列的标签前缀（多列且需要标签时为 "[列名]\\n"）。"""
+	with_label = add_label and len(columns) > 1
+	return [(col, f"[{col}]\n" if with_label else "") for col in columns]
+
+
+def _merge_prefixed(row: dict, prefixes: List[Tuple[str, str]]) -> str:
+	"""按预先计算的列前缀合并非空列内容。"""
+	return "\n\n".join(
+		[
+			prefix + value
+			for col, prefix in prefixes
+			if (value := (row.get(col) or "").strip())
+		]
+	)
 
 
 def merge_columns(row: dict, columns: List[str], add_label: bool = True) -> str:
 	"""合并多列内容。"""
-	if not columns:
-		return ""
-	
-	parts: List[str] = []
-	for col in columns:
-		value = (row.get(col, "") or "").strip()
-		if value:
-			if len(columns) > 1 and add_label:
-				parts.append(f"[{col}]\n{value}")
-			else:
-				parts.append(value)
-	
-	return "\n\n".join(parts)
+	return _merge_prefixed(row, _column_prefixes(columns, add_label))
 
 
 def convert_csv_to_jsonl(
@@ -67,33 +79,42 @@ def convert_csv_to_jsonl(
 		# 转换并写入 JSONL
 		print(f"📝 正在转换并写入：{output_jsonl}")
 		count = 0
+		encode = _ENCODE
+		sys_msg = {"role": "system", "content": system_content}
+		buf: List[str] = []
+		# 列前缀只计算一次，逐行合并时不再重复判断
+		user_prefixes = _column_prefixes(user_columns, add_label=True)
+		assistant_prefixes = _column_prefixes(assistant_columns or [], add_label=False)
 		
-		with open(output_jsonl, "w", encoding="utf-8") as out_fh:
+		with open(output_jsonl, "w", encoding="utf-8", buffering=1 << 20) as out_fh:
 			for row in reader:
 				# 合并 user 列
-				user_content = merge_columns(row, user_columns, add_label=True)
+				user_content = _merge_prefixed(row, user_prefixes)
 				
-				if not user_content.strip():
+				if not user_content:
 					continue  # 跳过空的 user 内容
 				
-				# 构建 messages
+				# 构建 messages（system 消息在所有行间共享）
 				messages: List[dict] = [
-					{"role": "system", "content": system_content},
+					sys_msg,
 					{"role": "user", "content": user_content},
 				]
 				
 				# 添加 assistant（如果有）
-				if assistant_columns:
-					assistant_content = merge_columns(
-						row, assistant_columns, add_label=False
-					)
-					if assistant_content.strip():
+				if assistant_prefixes:
+					assistant_content = _merge_prefixed(row, assistant_prefixes)
+					if assistant_content:
 						messages.append({"role": "assistant", "content": assistant_content})
 				
-				# 写入 JSONL
-				line = json.dumps({"messages": messages}, ensure_ascii=False)
-				out_fh.write(line + "\n")
+				# 缓冲后批量写入 JSONL
+				buf.append(encode({"messages": messages}) + "\n")
 				count += 1
+				if len(buf) >= _FLUSH_EVERY:
+					out_fh.writelines(buf)
+					buf.clear()
+			
+			if buf:
+				out_fh.writelines(buf)
 		
 		print(f"✅ 转换完成！共生成 {count} 条记录")
 		print(f"   - 输出文件：{output_jsonl}")
@@ -6,10 +6,10 @@ import argparse
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from rcc_extract.config import AppConfig
-from rcc_extract.patient_friendly import run_patient_friendly
+if TYPE_CHECKING:
+	from rcc_extract.config import AppConfig
 
 
 def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
@@ -112,6 +112,10 @@ def main(argv: Optional[list[str]] = None) -> None:
 	if args.system_prompt and args.system_prompt_file:
 		raise ValueError("不能同时使用 --system-prompt 和 --system-prompt-file")
 	
+	# 延迟导入：--help 及参数错误时无需加载 API 客户端等重量级依赖
+	from rcc_extract.config import AppConfig
+	from rcc_extract.patient_friendly import run_patient_friendly
+	
 	# 加载配置
 	config = AppConfig.from_env(provider=args.provider if args.provider else None)
 	apply_overrides(config, args)
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Optional
 
 from .templates import get_template
 
 
+@lru_cache(maxsize=8)
 def build_system_prompt(template_id: str = "rcc") -> str:
 	"""构建要求模型输出严格 JSON 的系统提示词。
 	
+	结果按 template_id 缓存；在进程内注册或修改模板后，需调用
+	``build_system_prompt.cache_clear()`` 使缓存失效。
+	
 	Args:
 		template_id: 模板 ID (rcc/lung_cancer/generic)
 	"""